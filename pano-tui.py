@@ -1,9 +1,14 @@
 import asyncio
-import requests
-import urllib3
-import xml.etree.ElementTree as ET
-from typing import Union, List, Tuple
+import base64
+import hashlib
+import random
+from dataclasses import dataclass
+import aiohttp
+from lxml import etree as ET
+from typing import Dict, Union, List, Tuple
 
+from rich.errors import MarkupError
+from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.widgets import (
@@ -17,30 +22,91 @@ from textual.widgets import (
     SelectionList,
 )
 from textual.widgets.selection_list import Selection
+from textual.worker import Worker
 from textual import on
 
-# Disable SSL certificate verification warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
 # --- Configuration ---
+@dataclass(frozen=True, slots=True)
+class Command:
+    """An operational command; `cmd` may contain a `{version}` placeholder."""
+    cmd: str
+    generates_job: bool = False
+
 # API Key is no longer in the templates
 URL_CHOICES = {
-    "Software Version Check": {
-        "cmd": "<request><system><software><check></check></software></system></request>",
-    },
-    "Download Version": {
-        "cmd": "<request><system><software><download><version>{version}</version></download></software></system></request>",
-        "generates_job": True
-    },
-    "Install Version": {
-        "cmd": "<request><system><software><install><version>{version}</version></install></software></system></request>",
-        "generates_job": True
-    },
-    "Reboot": {
-        "cmd": "<request><restart><system></system></restart></request>",
-    },
+    "Software Version Check": Command(
+        cmd="<request><system><software><check></check></software></system></request>",
+    ),
+    "Download Version": Command(
+        cmd="<request><system><software><download><version>{version}</version></download></software></system></request>",
+        generates_job=True,
+    ),
+    "Install Version": Command(
+        cmd="<request><system><software><install><version>{version}</version></install></software></system></request>",
+        generates_job=True,
+    ),
+    "Reboot": Command(
+        cmd="<request><restart><system></system></restart></request>",
+    ),
 }
 
+# Job polling starts at MIN_POLL_DELAY seconds and grows towards MAX_POLL_DELAY:
+# by POLL_BACKOFF while a job is unchanged, by PROGRESS_BACKOFF while only its progress moves
+MIN_POLL_DELAY = 2.0
+MAX_POLL_DELAY = 30.0
+POLL_BACKOFF = 1.5
+PROGRESS_BACKOFF = 1.2
+# Consecutive failed polls tolerated per job before it is no longer tracked
+MAX_POLL_ERRORS = 5
+# Longest Retry-After honoured, twice the backoff ceiling
+MAX_RETRY_AFTER = 2 * MAX_POLL_DELAY
+
+@dataclass(slots=True)
+class PendingJob:
+    """Polling state for one outstanding job; each job backs off on its own."""
+    # The Panorama, credentials and `show jobs` payload are fixed when the job is enqueued
+    url: str
+    headers: Dict[str, str]
+    payload: dict
+    due: float
+    status: Union[str, None] = None
+    progress: Union[str, None] = None
+    delay: float = MIN_POLL_DELAY
+    errors: int = 0
+
+# XPath queries are compiled once at import rather than reparsed on every response
+_ENTRY_XPATH = ET.XPath("./result/devices/entry")
+_VERSIONS = ET.XPath("./result/sw-updates/versions/entry/version")
+_JOB_ID = ET.XPath("./result/job")
+_JOB_STATUS = ET.XPath("./result/job/status")
+_JOB_RESULT = ET.XPath("./result/job/result")
+_JOB_DETAILS = ET.XPath("./result/job/details/line")
+_JOB_PROGRESS = ET.XPath("./result/job/progress")
+_ERR_MSG = ET.XPath("string(.//msg)")
+
+async def _parse_xml(data: bytes) -> ET._Element:
+    """Parses a large response body (the device list) on the default executor so it doesn't stall the UI."""
+    return await asyncio.get_running_loop().run_in_executor(None, ET.fromstring, data)
+
+def _retry_after(error: aiohttp.ClientResponseError) -> float:
+    """Returns the Retry-After delay of an HTTP error in seconds, capped at MAX_RETRY_AFTER, or 0 if absent or not numeric."""
+    value = error.headers.get("Retry-After") if error.headers else None
+    try:
+        return min(max(float(value), 0.0), MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return 0.0
+
+def _basic_auth_header(username: str, password: str) -> str:
+    """Builds a Basic Authorization header as requests did: latin-1 encoded, ':' allowed in the username."""
+    token = base64.b64encode(f"{username}:{password}".encode("latin-1")).decode("ascii")
+    return f"Basic {token}"
+
+def _is_transient(error: BaseException) -> bool:
+    """Connection errors, timeouts, 429 and 5xx are worth retrying; other HTTP errors are not."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+
 class PanoramaTUI(App):
     TITLE = "Panorama Command Runner"
     BINDINGS = [("ctrl+q", "quit", "Quit")]
@@ -83,6 +149,18 @@ class PanoramaTUI(App):
     def __init__(self):
         super().__init__()
         self.serial_to_hostname = {}
+        # Digest of the last successful device list and the (hostname, serial) pairs parsed from it
+        self._last_body_hash: Union[bytes, None] = None
+        self._last_pairs: List[Tuple[str, str]] = []
+        # Outstanding jobs keyed by (serial, job_id)
+        self.pending_jobs: Dict[Tuple[str, str], PendingJob] = {}
+        self.job_worker: Union[Worker, None] = None
+        # Wakes the poller when a job is enqueued while it is waiting on a later one
+        self._job_added = asyncio.Event()
+        # Set when devices are fetched so later calls target the same Panorama
+        self.base_url: Union[str, None] = None
+        # Messages are buffered and written to the RichLog at most once per 100ms
+        self._log_buffer: List[str] = []
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -119,206 +197,320 @@ class PanoramaTUI(App):
         yield Footer()
 
     async def on_mount(self) -> None:
-        log = self.query_one(RichLog)
-        log.write("Welcome! Enter your credentials and fetch devices to begin.")
+        # One session for the app's lifetime; SSL verification is disabled as before.
+        # Every call goes to the same Panorama, so the per-host limit is sized for
+        # many concurrent job polls and idle connections are kept alive between ticks.
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                ssl=False,
+                limit=200,
+                limit_per_host=64,
+                keepalive_timeout=75,
+                force_close=False,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        # Cache widget references once; `log` is reserved by App for its logger
+        self.output_log = self.query_one(RichLog)
+        self.pano_ip_input = self.query_one("#pano_ip", Input)
+        self.username_input = self.query_one("#username", Input)
+        self.password_input = self.query_one("#password", Input)
+        self.selection_list = self.query_one(SelectionList)
+        self.version_select = self.query_one("#version_select", Select)
+        self._log_flush_timer = self.set_interval(0.1, self._flush_log)
+        self.log_line("Welcome! Enter your credentials and fetch devices to begin.")
+
+    async def on_unmount(self) -> None:
+        # Stop the poller before its session goes away
+        if self.job_worker is not None:
+            self.job_worker.cancel()
+        await self.session.close()
+
+    def log_line(self, msg: str) -> None:
+        """Queues a line for the output log; see _flush_log."""
+        self._log_buffer.append(msg)
+
+    def _flush_log(self) -> None:
+        # Swap the buffer out first so a failing write can't replay or drop the batch
+        lines, self._log_buffer = self._log_buffer, []
+        # Textual coalesces the refreshes, so each message is still one redraw per tick.
+        # Writing them separately keeps a stray tag from styling or breaking its neighbours.
+        for line in lines:
+            try:
+                self.output_log.write(line)
+            except MarkupError:
+                self.output_log.write(Text(line))
+
+    async def _api(self, url: str, params: dict, headers: Union[Dict[str, str], None] = None) -> bytes:
+        """Runs a non-blocking GET with the session's Basic Authentication, unless `headers` overrides it, and returns the raw body."""
+        async with self.session.get(url, params=params, headers=headers) as response:
+            response.raise_for_status()
+            return await response.read()
 
-    def run_api_request(self, url: str, params: dict, auth: tuple) -> requests.Response:
-        """Runs a synchronous request with Basic Authentication."""
-        return requests.get(url, params=params, auth=auth, verify=False, timeout=30)
+    async def _api_status(self, url: str, params: dict, headers: Union[Dict[str, str], None] = None) -> int:
+        """Like _api, but only checks the status and never downloads the body."""
+        async with self.session.get(url, params=params, headers=headers) as response:
+            response.raise_for_status()
+            return response.status
 
-    async def fetch_devices(self, auth: tuple) -> None:
-        log = self.query_one(RichLog)
-        selection_list = self.query_one(SelectionList)
+    async def fetch_devices(self) -> None:
+        selection_list = self.selection_list
         selection_list.clear_options()
         self.serial_to_hostname.clear()
         
-        pano_ip = self.query_one("#pano_ip").value
+        pano_ip = self.pano_ip_input.value
         if not pano_ip:
-            log.write("[red]Error: Panorama IP is required.[/red]")
+            self.log_line("[red]Error: Panorama IP is required.[/red]")
             return
 
-        log.write(f"Fetching devices from {pano_ip}...")
-        base_url = f"https://{pano_ip}/api/"
+        self.log_line(f"Fetching devices from {pano_ip}...")
+        self.base_url = f"https://{pano_ip}/api/"
         payload = { 'type': 'op', 'cmd': '<show><devices><connected></connected></devices></show>' }
         
         try:
-            response = await asyncio.to_thread(self.run_api_request, base_url, payload, auth)
-            response.raise_for_status()
-            root = ET.fromstring(response.text)
-            if root.attrib["status"] == "error":
-                # Check for common auth failure message
-                msg_node = root.find(".//msg")
-                error_msg = msg_node.text if msg_node is not None else "Unknown API error"
-                if "authentication failed" in error_msg.lower():
-                    log.write("[red]API Error: Authentication failed. Please check your username and password.[/red]")
-                else:
-                    log.write(f"[red]API Error: {error_msg}[/red]")
-                return
+            data = await self._api(self.base_url, payload)
+            # Repeat fetches of an unchanged inventory reuse the previous parse
+            body_hash = hashlib.blake2b(data, digest_size=16).digest()
+            if body_hash == self._last_body_hash:
+                pairs = self._last_pairs
+            else:
+                root = await _parse_xml(data)
+                if root.attrib["status"] == "error":
+                    # Check for common auth failure message
+                    error_msg = _ERR_MSG(root) or "Unknown API error"
+                    if "authentication failed" in error_msg.lower():
+                        self.log_line("[red]API Error: Authentication failed. Please check your username and password.[/red]")
+                    else:
+                        self.log_line(f"[red]API Error: {error_msg}[/red]")
+                    return
 
-            options = []
-            for entry in root.findall("./result/devices/entry"):
-                hostname_node = entry.find("hostname")
-                serial_node = entry.find("serial")
-                if hostname_node is not None and serial_node is not None:
-                    hostname, serial = hostname_node.text, serial_node.text
-                    self.serial_to_hostname[serial] = hostname
-                    options.append(Selection(f"{hostname} ({serial})", serial))
-            
-            options.sort(key=lambda sel: sel.prompt)
+                # Single pass over the entries; (hostname, serial) tuples sort in the same order as the prompts
+                entries = ((entry.findtext("hostname"), entry.findtext("serial")) for entry in _ENTRY_XPATH(root))
+                pairs = sorted(pair for pair in entries if None not in pair)
+                self._last_body_hash, self._last_pairs = body_hash, pairs
+
+            self.serial_to_hostname = {serial: hostname for hostname, serial in pairs}
+            options = [Selection(f"{hostname} ({serial})", serial) for hostname, serial in pairs]
 
             selection_list.add_options(options)
-            log.write(f"[green]Success! Found {len(options)} connected devices.[/green]")
+            self.log_line(f"[green]Success! Found {len(options)} connected devices.[/green]")
         
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 403:
-                log.write("[red]Connection Error: Received status 403 Forbidden. Please check your username and password.[/red]")
+        except aiohttp.ClientResponseError as e:
+            if e.status == 403:
+                self.log_line("[red]Connection Error: Received status 403 Forbidden. Please check your username and password.[/red]")
             else:
-                log.write(f"[red]HTTP Error: {e}[/red]")
-        except requests.exceptions.RequestException as e:
-            log.write(f"[red]Connection Error: {e}[/red]")
+                self.log_line(f"[red]HTTP Error: {e}[/red]")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.log_line(f"[red]Connection Error: {e}[/red]")
 
-    async def run_version_check(self, auth: tuple) -> None:
-        log = self.query_one(RichLog)
-        selection_list = self.query_one(SelectionList)
-        version_select = self.query_one("#version_select")
+    async def run_version_check(self) -> None:
+        selection_list = self.selection_list
+        version_select = self.version_select
 
         if not selection_list.selected:
-            log.write("[red]Error: Please select one device to check for versions.[/red]")
+            self.log_line("[red]Error: Please select one device to check for versions.[/red]")
             return
 
         target_serial = selection_list.selected[0]
         target_hostname = self.serial_to_hostname.get(target_serial, target_serial)
-        log.write(f"Running Software Version Check on {target_hostname}...")
+        self.log_line(f"Running Software Version Check on {target_hostname}...")
 
-        pano_ip = self.query_one("#pano_ip").value
-        
-        base_url = f"https://{pano_ip}/api/"
-        payload = { 'type': 'op', 'cmd': URL_CHOICES["Software Version Check"]['cmd'], 'target': target_serial }
+        payload = { 'type': 'op', 'cmd': URL_CHOICES["Software Version Check"].cmd, 'target': target_serial }
 
         try:
-            response = await asyncio.to_thread(self.run_api_request, base_url, payload, auth)
-            response.raise_for_status()
-            root = ET.fromstring(response.text)
+            root = ET.fromstring(await self._api(self.base_url, payload))
             if root.attrib["status"] == "error":
-                error_msg = root.find(".//msg").text
-                log.write(f"[red]API Error: {error_msg}[/red]")
+                error_msg = _ERR_MSG(root) or "Unknown API error"
+                self.log_line(f"[red]API Error: {error_msg}[/red]")
                 return
             
-            versions = [v.text for v in root.findall('./result/sw-updates/versions/entry/version')]
+            versions = [v.text for v in _VERSIONS(root)]
             
             if not versions:
-                log.write("[yellow]Warning: No software versions found.[/yellow]")
+                self.log_line("[yellow]Warning: No software versions found.[/yellow]")
                 return
 
             version_select.set_options([(v, v) for v in versions])
             version_select.disabled = False
-            log.write(f"[green]Success! Found {len(versions)} versions. Dropdown populated.[/green]")
+            self.log_line(f"[green]Success! Found {len(versions)} versions. Dropdown populated.[/green]")
         
-        except requests.exceptions.RequestException as e:
-            log.write(f"[red]Connection Error: {e}[/red]")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.log_line(f"[red]Connection Error: {e}[/red]")
 
-    async def track_job_progress(self, auth: tuple, serial: str, job_id: str) -> None:
-        log = self.query_one(RichLog)
+    async def _query_job(self, serial: str, job_id: str) -> Union[Tuple[str, Union[str, None]], None]:
+        """Polls one job once. Returns its (status, progress), or None when tracking should stop."""
         hostname = self.serial_to_hostname.get(serial, serial)
+        # Connection and HTTP errors propagate so _poll_loop can retry them
+        job = self.pending_jobs[(serial, job_id)]
+        root = ET.fromstring(await self._api(job.url, job.payload, job.headers))
+        
+        status_nodes = _JOB_STATUS(root)
+        if not status_nodes:
+            self.log_line(f"[yellow]Warning: Could not determine status for job {job_id} on {hostname}.[/yellow]")
+            return None
         
-        while True:
-            await asyncio.sleep(5)
+        status = status_nodes[0].text
+        progress_nodes = _JOB_PROGRESS(root)
+        progress = progress_nodes[0].text if progress_nodes else None
+
+        if status == 'FIN':
+            result_nodes = _JOB_RESULT(root)
+            if result_nodes and result_nodes[0].text == 'OK':
+                self.log_line(f"[green]✅ Job {job_id} on {hostname} FINISHED successfully.[/green]")
+            else:
+                details = "\n".join([line.text for line in _JOB_DETAILS(root)])
+                self.log_line(f"[red]❌ Job {job_id} on {hostname} FINISHED with failure.[/red]\n{details}")
+            return None
+        elif status == 'ACT':
+            if progress:
+                self.log_line(f"  -> Job {job_id} on {hostname} is downloading... {progress}% complete.")
+        else:
+             self.log_line(f"  -> Job {job_id} on {hostname} is ongoing. Status: {status}")
+        return status, progress
+
+    async def _poll_loop(self) -> None:
+        """Polls each outstanding job when it falls due, batching jobs due together into one round."""
+        loop = asyncio.get_running_loop()
+        
+        while self.pending_jobs:
+            # Sleep until the earliest job is due, or until a new job is enqueued
+            self._job_added.clear()
+            next_due = min(job.due for job in self.pending_jobs.values())
+            try:
+                await asyncio.wait_for(self._job_added.wait(), timeout=max(0.0, next_due - loop.time()))
+            except asyncio.TimeoutError:
+                pass
             
-            pano_ip = self.query_one("#pano_ip").value
-            base_url = f"https://{pano_ip}/api/"
-            payload = { 'type': 'op', 'cmd': f'<show><jobs><id>{job_id}</id></jobs></show>', 'target': serial }
+            now = loop.time()
+            jobs = [key for key, job in self.pending_jobs.items() if job.due <= now]
+            if not jobs:
+                continue
+            results = await asyncio.gather(
+                *(self._query_job(serial, job_id) for serial, job_id in jobs),
+                return_exceptions=True,
+            )
             
-            try:
-                response = await asyncio.to_thread(self.run_api_request, base_url, payload, auth)
-                response.raise_for_status()
-                root = ET.fromstring(response.text)
+            for (serial, job_id), result in zip(jobs, results):
+                key = (serial, job_id)
+                job = self.pending_jobs[key]
+                hostname = self.serial_to_hostname.get(serial, serial)
+                retry_after = 0.0
+                if _is_transient(result):
+                    # Transient failures (429/5xx under load, dropped connections) are retried before giving up
+                    job.errors += 1
+                    if job.errors < MAX_POLL_ERRORS:
+                        self.log_line(f"[yellow]Warning: Error checking job {job_id} on {hostname} ({job.errors}/{MAX_POLL_ERRORS}), retrying: {result}[/yellow]")
+                        if isinstance(result, aiohttp.ClientResponseError):
+                            retry_after = _retry_after(result)
+                        job.delay = min(job.delay * POLL_BACKOFF, MAX_POLL_DELAY)
+                        job.due = loop.time() + max(job.delay, retry_after) + random.uniform(0, 0.5)
+                        continue
+                if isinstance(result, Exception):
+                    self.log_line(f"[red]❌ Error checking job {job_id} on {hostname}: {result}[/red]")
+                    result = None
+                if result is None:
+                    del self.pending_jobs[key]
+                    continue
                 
-                status_node = root.find('./result/job/status')
-                if status_node is None:
-                    log.write(f"[yellow]Warning: Could not determine status for job {job_id} on {hostname}.[/yellow]")
-                    break
-                
-                status = status_node.text
-                if status == 'FIN':
-                    result = root.find('./result/job/result').text
-                    if result == 'OK':
-                        log.write(f"[green]✅ Job {job_id} on {hostname} FINISHED successfully.[/green]")
-                    else:
-                        details = "\n".join([line.text for line in root.findall('./result/job/details/line')])
-                        log.write(f"[red]❌ Job {job_id} on {hostname} FINISHED with failure.[/red]\n{details}")
-                    break
-                elif status == 'ACT':
-                    progress_node = root.find('./result/job/progress')
-                    if progress_node is not None and progress_node.text:
-                        log.write(f"  -> Job {job_id} on {hostname} is downloading... {progress_node.text}% complete.")
+                # Reset on a status transition; otherwise back off, more gently while progress moves
+                job.errors = 0
+                status, progress = result
+                if status != job.status:
+                    job.delay = MIN_POLL_DELAY
+                elif progress != job.progress:
+                    job.delay = min(job.delay * PROGRESS_BACKOFF, MAX_POLL_DELAY)
                 else:
-                     log.write(f"  -> Job {job_id} on {hostname} is ongoing. Status: {status}")
+                    job.delay = min(job.delay * POLL_BACKOFF, MAX_POLL_DELAY)
+                job.status, job.progress = status, progress
+                job.due = loop.time() + job.delay + random.uniform(0, 0.5)
 
-            except requests.exceptions.RequestException as e:
-                log.write(f"[red]❌ Error checking job {job_id} on {hostname}: {e}[/red]")
-                break
+    async def _dispatch_one(self, serial: str, command_info: Command, command_name: str, command_xml: str) -> None:
+        hostname = self.serial_to_hostname.get(serial, serial)
+        # Captured before any await so the request and its job keep the credentials they started with
+        authorization = self.session.headers.get("Authorization")
+        headers = {"Authorization": authorization} if authorization else {}
+        
+        payload = { 'type': 'op', 'cmd': command_xml, 'target': serial }
+        
+        self.log_line(f"--- Running '{command_name}' on {hostname} ---")
+        
+        try:
+            if command_info.generates_job:
+                root = ET.fromstring(await self._api(self.base_url, payload, headers))
+                job_id_nodes = _JOB_ID(root)
+                if job_id_nodes and job_id_nodes[0].text:
+                    job_id = job_id_nodes[0].text
+                    self.log_line(f"Job enqueued (ID: {job_id}) on {hostname}. Monitoring...")
+                    self.pending_jobs[(serial, job_id)] = PendingJob(
+                        url=self.base_url,
+                        headers=headers,
+                        payload={ 'type': 'op', 'cmd': f'<show><jobs><id>{job_id}</id></jobs></show>', 'target': serial },
+                        due=asyncio.get_running_loop().time() + MIN_POLL_DELAY + random.uniform(0, 0.5),
+                    )
+                    self._job_added.set()
+                    if self.job_worker is None or self.job_worker.is_finished:
+                        self.job_worker = self.run_worker(self._poll_loop(), group="job_poll")
+                else:
+                    self.log_line(f"[red]❌ Error: Command '{command_name}' did not return a job ID for {hostname}.[/red]")
+            else:
+                status = await self._api_status(self.base_url, payload, headers)
+                self.log_line(f"[green]✅ Success on {hostname} (Status Code: {status})[/green]")
 
-    async def run_execute_command(self, auth: tuple, command_name: str, version: Union[str, None]) -> None:
-        log = self.query_one(RichLog)
-        selection_list = self.query_one(SelectionList)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.log_line(f"[red]❌ Error for {hostname}: {e}[/red]")
+
+    async def run_execute_command(self, command_name: str, version: Union[str, None]) -> None:
+        selection_list = self.selection_list
         selected_serials = selection_list.selected
         if not selected_serials:
-            log.write("[red]Error: No devices selected.[/red]")
+            self.log_line("[red]Error: No devices selected.[/red]")
             return
 
-        pano_ip = self.query_one("#pano_ip").value
         command_info = URL_CHOICES[command_name]
+        # The command is the same for every device, so fill in the version once per run
+        command_xml = command_info.cmd.replace("{version}", version) if version else command_info.cmd
 
-        log.write(f"\n--- Starting '{command_name}' on {len(selected_serials)} device(s) ---")
+        self.log_line(f"\n--- Starting '{command_name}' on {len(selected_serials)} device(s) ---")
         
-        for serial in selected_serials:
-            hostname = self.serial_to_hostname.get(serial, serial)
-            base_url = f"https://{pano_ip}/api/"
-            
-            command_xml = command_info['cmd'].format(version=version) if version else command_info['cmd']
-            payload = { 'type': 'op', 'cmd': command_xml, 'target': serial }
-            
-            log.write(f"--- Running '{command_name}' on {hostname} ---")
-            
-            try:
-                response = await asyncio.to_thread(self.run_api_request, base_url, payload, auth)
-                response.raise_for_status()
-                
-                if command_info.get("generates_job"):
-                    root = ET.fromstring(response.text)
-                    job_id_node = root.find('./result/job')
-                    if job_id_node is not None and job_id_node.text:
-                        job_id = job_id_node.text
-                        log.write(f"Job enqueued (ID: {job_id}) on {hostname}. Monitoring...")
-                        self.run_worker(self.track_job_progress(auth, serial, job_id))
-                    else:
-                        log.write(f"[red]❌ Error: Command '{command_name}' did not return a job ID for {hostname}.[/red]")
-                else:
-                    log.write(f"[green]✅ Success (Status Code: {response.status_code})[/green]")
-
-            except requests.exceptions.RequestException as e:
-                log.write(f"[red]❌ Error for {hostname}: {e}[/red]")
+        # Send the initial request to every device at once rather than one after another
+        coros = [
+            self._dispatch_one(serial, command_info, command_name, command_xml)
+            for serial in selected_serials
+        ]
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for serial, result in zip(selected_serials, results):
+            if isinstance(result, Exception):
+                hostname = self.serial_to_hostname.get(serial, serial)
+                self.log_line(f"[red]❌ Unexpected error for {hostname}: {result}[/red]")
 
     @on(Button.Pressed)
     def handle_button_press(self, event: Button.Pressed) -> None:
-        log = self.query_one(RichLog)
-        username = self.query_one("#username").value
-        password = self.query_one("#password").value
+        username = self.username_input.value
+        password = self.password_input.value
 
         if not username or not password:
             if event.button.id != "fetch" and not self.serial_to_hostname:
                 # Allow fetching devices without creds, but not other actions
                 pass
             else:
-                log.write("[red]Error: Username and Password are required.[/red]")
+                self.log_line("[red]Error: Username and Password are required.[/red]")
                 return
         
-        auth = (username, password)
+        # Credentials are constant between presses, so the header is encoded once here
+        # rather than on every request. Without credentials the header from the last
+        # press is left alone; pending jobs keep their own copy either way.
+        if username and password:
+            try:
+                self.session.headers["Authorization"] = _basic_auth_header(username, password)
+            except UnicodeEncodeError:
+                self.log_line("[red]Error: Username and Password may only contain Latin-1 characters.[/red]")
+                return
 
         if event.button.id == "fetch":
-            self.run_worker(self.fetch_devices(auth))
+            self.run_worker(self.fetch_devices())
         elif event.button.id == "run_check_versions":
-            self.run_worker(self.run_version_check(auth))
+            self.run_worker(self.run_version_check())
         elif event.button.id in ("run_download", "run_install", "run_reboot"):
             command_name = ""
             if event.button.id == "run_download": command_name = "Download Version"
@@ -326,15 +518,21 @@ class PanoramaTUI(App):
             elif event.button.id == "run_reboot": command_name = "Reboot"
 
             version = None
-            if URL_CHOICES[command_name].get("generates_job"):
-                version = self.query_one("#version_select").value
+            if URL_CHOICES[command_name].generates_job:
+                version = self.version_select.value
                 if version is Select.BLANK:
-                    log.write("[red]Error: Please run a version check and select a version first.[/red]")
+                    self.log_line("[red]Error: Please run a version check and select a version first.[/red]")
                     return
             
-            self.run_worker(self.run_execute_command(auth, command_name, version))
+            self.run_worker(self.run_execute_command(command_name, version))
 
 
 if __name__ == "__main__":
     app = PanoramaTUI()
-    app.run()
\ No newline at end of file
+    # uvloop is optional; it schedules the pollers and sockets more cheaply when installed
+    try:
+        import uvloop
+    except ImportError:
+        app.run()
+    else:
+        app.run(loop=uvloop.new_event_loop())
\ No newline at end of file